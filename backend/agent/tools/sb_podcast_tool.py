@@ -1,10 +1,11 @@
 import os
 import json
-import tempfile
+import random
 import asyncio
-import datetime
 import time
-import requests
+import uuid
+import string
+import aiohttp
 from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
@@ -13,6 +14,11 @@ from sandbox.tool_base import SandboxToolsBase
 from agentpress.thread_manager import ThreadManager
 from utils.logger import logger
 
+# Maps every ASCII character that is unsafe in a file name to "_" so output names are
+# cleaned in one C-level pass instead of a chain of regex substitutions
+_FILENAME_SAFE_CHARS = set(string.ascii_letters + string.digits + "-_")
+_FILENAME_TABLE = str.maketrans({chr(i): "_" for i in range(128) if chr(i) not in _FILENAME_SAFE_CHARS})
+
 
 class SandboxPodcastTool(SandboxToolsBase):
     """
@@ -36,19 +42,118 @@ class SandboxPodcastTool(SandboxToolsBase):
     and generates high-quality audio using ElevenLabs TTS.
     """
 
+    # Overall bound (seconds) on one podcast: every generation attempt, retry backoff and the
+    # audio download together. Each attempt is separately capped at 360s and the download at 60s.
+    GENERATION_TIMEOUT = 900
+    # Per-file cap on text sent to Podcastfy; anything past this won't fit the LLM context anyway
+    MAX_PROMPT_CHARS = 50_000
+    # Retry policy for Podcastfy failures that cannot have started a generation (see _is_retryable_error)
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+
+    # Environment configuration, read once per process by _init_once()
+    _env_loaded = False
+    _api_base_url = None
+    _gemini_key = ''
+    _openai_key = ''
+    _elevenlabs_key = ''
+
+    # Upper bound on concurrent Podcastfy generations per process
+    MAX_CONCURRENT_GENERATIONS = int(os.getenv("PODCAST_MAX_CONCURRENT", "10"))
+
+    # Process-wide state bound to the event loop it was created on: a keep-alive HTTP session
+    # shared by every instance and the generation semaphore. Both are rebuilt by
+    # _bind_to_running_loop() when the tool is used from a different loop.
+    _bound_loop: Optional[asyncio.AbstractEventLoop] = None
+    _http_session: Optional[aiohttp.ClientSession] = None
+    _generation_semaphore: Optional[asyncio.Semaphore] = None
+
     def __init__(self, project_id: str, thread_manager: ThreadManager):
         super().__init__(project_id, thread_manager)
         self.workspace_path = "/workspace"
-        self.api_base_url = os.getenv('PODCASTFY_API_URL', 'https://podcastfy-8x6a.onrender.com')
-        self.gemini_key = os.getenv('GEMINI_API_KEY', '')
-        self.openai_key = os.getenv('OPENAI_API_KEY', '')
-        self.elevenlabs_key = os.getenv('ELEVENLABS_API_KEY', '')
+        self._podcasts_dir_created = False
+        self._init_once()
         
         # Validate required environment variables
-        if not self.openai_key and not self.gemini_key:
+        if not self._openai_key and not self._gemini_key:
             raise ValueError("Either OPENAI_API_KEY or GEMINI_API_KEY must be set")
         # Note: ELEVENLABS_API_KEY is now optional - will be validated when tool is used
 
+    @classmethod
+    def _init_once(cls):
+        """Load the Podcastfy API configuration from the environment on first use."""
+        if cls._env_loaded:
+            return
+        cls._api_base_url = os.getenv('PODCASTFY_API_URL', 'https://podcastfy-8x6a.onrender.com')
+        cls._gemini_key = os.getenv('GEMINI_API_KEY', '')
+        cls._openai_key = os.getenv('OPENAI_API_KEY', '')
+        cls._elevenlabs_key = os.getenv('ELEVENLABS_API_KEY', '')
+        cls._env_loaded = True
+        logger.info(f"Podcast tool configured with Podcastfy API at {cls._api_base_url}")
+
+    @classmethod
+    async def _bind_to_running_loop(cls):
+        """Recreate the loop-bound session and semaphore when called from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if cls._bound_loop is loop:
+            return
+        stale_session, stale_loop = cls._http_session, cls._bound_loop
+        # Swap in fresh state before awaiting anything so concurrent callers on this loop see it
+        cls._http_session = None
+        cls._generation_semaphore = asyncio.Semaphore(cls.MAX_CONCURRENT_GENERATIONS)
+        cls._bound_loop = loop
+        await cls._discard_stale_session(stale_session, stale_loop)
+
+    @classmethod
+    async def _discard_stale_session(cls, session: Optional[aiohttp.ClientSession], loop: Optional[asyncio.AbstractEventLoop]):
+        """Close a session created on a previous event loop."""
+        if session is None or session.closed:
+            return
+        try:
+            if loop is not None and loop.is_running():
+                # The owning loop is still alive in another thread; close the session there
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                # The owning loop has stopped, so its transports can't be closed gracefully;
+                # closing here marks the connector closed and releases its pool
+                await session.close()
+        except Exception as e:
+            logger.debug(f"Error closing stale podcast HTTP session: {e}")
+
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """Get or create the shared aiohttp session for Podcastfy API requests."""
+        await cls._bind_to_running_loop()
+        # No awaits between the check and the assignment, so no lock is needed within a loop
+        if cls._http_session is None or cls._http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            cls._http_session = aiohttp.ClientSession(connector=connector)
+        return cls._http_session
+
+    @classmethod
+    async def close_session(cls):
+        """Close the shared aiohttp session."""
+        if cls._http_session and not cls._http_session.closed:
+            await cls._http_session.close()
+        cls._http_session = None
+
+    @staticmethod
+    def _safe_output_name(output_name: Optional[str]) -> str:
+        """Sanitize a user-supplied output name so it stays inside podcasts/, or generate one."""
+        if output_name:
+            # No separators or "..": every unsafe ASCII character becomes "_"
+            output_name = output_name.strip().translate(_FILENAME_TABLE)[:100]
+        if not output_name:
+            # Random suffix keeps names unique when two podcasts finish in the same second
+            output_name = f"podcast_{int(time.time())}_{uuid.uuid4().hex[:6]}"
+        return output_name
+
     def _validate_file_exists(self, file_path: str) -> bool:
         """Check if a file exists in the sandbox."""
         try:
@@ -57,6 +162,13 @@ class SandboxPodcastTool(SandboxToolsBase):
         except Exception:
             return False
 
+    def _download_file_if_exists(self, file_path: str) -> Optional[bytes]:
+        """Download a workspace-relative file from the sandbox, or return None if it doesn't exist."""
+        full_path = f"{self.workspace_path}/{self.clean_path(file_path)}"
+        if not self._validate_file_exists(full_path):
+            return None
+        return self.sandbox.fs.download_file(full_path)
+
     @openapi_schema({
         "type": "function",
         "function": {
@@ -261,7 +373,7 @@ class SandboxPodcastTool(SandboxToolsBase):
                 return self.fail_response("At least one content source (URLs, files, text, or topic) must be provided")
             
             # Check for ElevenLabs API key when actually using the tool
-            if not self.elevenlabs_key:
+            if not self._elevenlabs_key:
                 return self.fail_response("ELEVENLABS_API_KEY must be set to generate podcasts. Please configure this environment variable.")
             
             # Process URLs - combine with file content for now
@@ -279,23 +391,27 @@ class SandboxPodcastTool(SandboxToolsBase):
                         continue
             
             # Process files - read file content and send as text to FastAPI (not the files themselves)
-            file_content = ""
+            file_parts = []
             if file_paths:
-                for file_path in file_paths:
-                    try:
-                        clean_path = self.clean_path(file_path)
-                        full_path = f"{self.workspace_path}/{clean_path}"
-                        if self._validate_file_exists(full_path):
-                            file_info = self.sandbox.fs.get_file_info(full_path)
-                            file_bytes = self.sandbox.fs.download_file(full_path)
-                            file_text = file_bytes.decode('utf-8', errors='ignore')
-                            file_content += f"\n\nContent from {file_path}:\n{file_text}"
-                            logger.info(f"File read successfully: {file_path} ({len(file_text)} characters)")
-                        else:
-                            logger.warning(f"File not found: {file_path}")
-                    except Exception as e:
-                        logger.error(f"Error reading file {file_path}: {str(e)}")
-                        file_content += f"\n\nError reading {file_path}: {str(e)}"
+                # Fetch all files concurrently so sandbox round trips overlap
+                downloads = await asyncio.gather(
+                    *(asyncio.to_thread(self._download_file_if_exists, file_path) for file_path in file_paths),
+                    return_exceptions=True
+                )
+                for file_path, file_bytes in zip(file_paths, downloads):
+                    if isinstance(file_bytes, Exception):
+                        logger.error(f"Error reading file {file_path}: {str(file_bytes)}")
+                        file_parts.append(f"\n\nError reading {file_path}: {str(file_bytes)}")
+                    elif file_bytes is None:
+                        logger.warning(f"File not found: {file_path}")
+                    else:
+                        file_text = file_bytes.decode('utf-8', errors='ignore')
+                        if len(file_text) > self.MAX_PROMPT_CHARS:
+                            logger.info(f"Truncated {file_path} from {len(file_text)} to {self.MAX_PROMPT_CHARS} characters")
+                            file_text = file_text[:self.MAX_PROMPT_CHARS]
+                        file_parts.append(f"\n\nContent from {file_path}:\n{file_text}")
+                        logger.info(f"File read successfully: {file_path} ({len(file_text)} characters)")
+            file_content = "".join(file_parts)
             
             # Combine all text content
             combined_text = ""
@@ -313,8 +429,8 @@ class SandboxPodcastTool(SandboxToolsBase):
                     combined_text = file_content
             
             # Send both API keys - let the FastAPI decide which to use
-            openai_key = self.openai_key
-            google_key = self.gemini_key
+            openai_key = self._openai_key
+            google_key = self._gemini_key
             
             llm_info = []
             if openai_key:
@@ -330,10 +446,10 @@ class SandboxPodcastTool(SandboxToolsBase):
             # Prepare request payload for FastAPI
             payload = {
                 "urls": processed_urls,
-                "text": combined_text.strip() if combined_text.strip() else None,
+                "text": combined_text.strip() or None,
                 "openai_key": openai_key,
                 "google_key": google_key,
-                "elevenlabs_key": self.elevenlabs_key,
+                "elevenlabs_key": self._elevenlabs_key,
                 "tts_model": "elevenlabs",
                 "creativity": creativity,
                 "conversation_style": conversation_style,
@@ -349,69 +465,67 @@ class SandboxPodcastTool(SandboxToolsBase):
                 "voices": voices or {}
             }
             
-            # Make API request to FastAPI
-            result = self._make_fastapi_request(payload)
-            
-            if not result.get("audioUrl"):
+            # Make API request to FastAPI; aiohttp keeps the event loop free for other tool calls.
+            # The semaphore caps in-flight generations per process so excess jobs wait their turn.
+            try:
+                await self._bind_to_running_loop()
+                async with self._generation_semaphore:
+                    audio_content = await asyncio.wait_for(
+                        self._generate_audio(payload),
+                        timeout=self.GENERATION_TIMEOUT
+                    )
+            except asyncio.TimeoutError:
+                return self.fail_response(f"Podcast generation timed out after {self.GENERATION_TIMEOUT} seconds")
+            
+            if audio_content is None:
                 return self.fail_response(f"Podcast generation failed: No audio URL returned")
             
-            # Download the audio file
-            local_path = self._download_audio_file(result["audioUrl"])
-            
             # Create podcasts directory in workspace
             podcasts_dir = f"{self.workspace_path}/podcasts"
-            self.sandbox.fs.create_folder(podcasts_dir, "755")
+            # The directory only needs creating once per sandbox; skip the RPC on later podcasts
+            if not self._podcasts_dir_created:
+                await asyncio.to_thread(self.sandbox.fs.create_folder, podcasts_dir, "755")
+                self._podcasts_dir_created = True
             
             # Determine output filename
-            if not output_name:
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_name = f"podcast_{timestamp}"
-            
-            # Upload to sandbox
-            with open(local_path, 'rb') as f:
-                audio_content = f.read()
+            output_name = self._safe_output_name(output_name)
             
+            # Upload to sandbox without blocking the event loop on sandbox I/O
             audio_filename = f"{output_name}.mp3"
             audio_path = f"{podcasts_dir}/{audio_filename}"
-            self.sandbox.fs.upload_file(audio_content, audio_path)
-            
-            # Clean up local file
-            try:
-                os.unlink(local_path)
-            except:
-                pass
+            await asyncio.to_thread(self.sandbox.fs.upload_file, audio_content, audio_path)
             
             # Prepare success message
-            message = f"🎙️ Podcast generated successfully!\n\nGenerated files:\n"
-            message += f"- podcasts/{audio_filename}\n"
+            parts = [f"🎙️ Podcast generated successfully!\n\nGenerated files:\n"]
+            parts.append(f"- podcasts/{audio_filename}\n")
             
             # Add content source summary
-            message += f"\nContent sources processed:\n"
+            parts.append(f"\nContent sources processed:\n")
             if topic:
-                message += f"- Topic: {topic}\n"
+                parts.append(f"- Topic: {topic}\n")
             if urls:
-                message += f"- {len(urls)} URLs\n"
+                parts.append(f"- {len(urls)} URLs\n")
             if file_paths:
-                file_chars = len(file_content.strip()) if file_content.strip() else 0
-                message += f"- {len(file_paths)} local files (content read as text: {file_chars} characters)\n" 
+                file_chars = len(file_content.strip())
+                parts.append(f"- {len(file_paths)} local files (content read as text: {file_chars} characters)\n")
             if text:
-                text_chars = len(text.strip()) if text.strip() else 0
-                message += f"- Direct text input ({text_chars} characters)\n"
-            
-            message += f"\nConfiguration:\n"
-            message += f"- Style: {', '.join(conversation_style)}\n"
-            message += f"- Length: {podcast_length}\n"
-            message += f"- Language: {language}\n"
-            message += f"- TTS Model: ElevenLabs\n"
-            message += f"- Podcast: {podcast_name}\n"
-            message += f"- Speakers: {roles_person1} & {roles_person2}\n"
-            message += f"- Structure: {', '.join(dialogue_structure)}\n"
-            message += f"- Engagement: {', '.join(engagement_techniques)}\n"
-            message += f"- Creativity: {creativity}\n"
+                text_chars = len(text.strip())
+                parts.append(f"- Direct text input ({text_chars} characters)\n")
+            
+            parts.append(f"\nConfiguration:\n")
+            parts.append(f"- Style: {', '.join(conversation_style)}\n")
+            parts.append(f"- Length: {podcast_length}\n")
+            parts.append(f"- Language: {language}\n")
+            parts.append(f"- TTS Model: ElevenLabs\n")
+            parts.append(f"- Podcast: {podcast_name}\n")
+            parts.append(f"- Speakers: {roles_person1} & {roles_person2}\n")
+            parts.append(f"- Structure: {', '.join(dialogue_structure)}\n")
+            parts.append(f"- Engagement: {', '.join(engagement_techniques)}\n")
+            parts.append(f"- Creativity: {creativity}\n")
             if user_instructions:
-                message += f"- Instructions: {user_instructions}\n"
+                parts.append(f"- Instructions: {user_instructions}\n")
             
-            return self.success_response(message)
+            return self.success_response("".join(parts))
             
         except Exception as e:
             logger.error(f"Error in podcast generation: {str(e)}", exc_info=True)
@@ -453,7 +567,7 @@ class SandboxPodcastTool(SandboxToolsBase):
             
             # Check if podcasts directory exists
             try:
-                files = self.sandbox.fs.list_files(podcasts_dir)
+                files = await asyncio.to_thread(self.sandbox.fs.list_files, podcasts_dir)
             except Exception:
                 return self.success_response("🎙️ No podcasts found. Use generate_podcast to create your first podcast!")
             
@@ -490,18 +604,18 @@ class SandboxPodcastTool(SandboxToolsBase):
             if not podcasts:
                 return self.success_response("🎙️ No podcast files found in the podcasts directory.")
             
-            message = f"🎙️ Found {len(podcasts)} podcast(s):\n\n"
+            parts = [f"🎙️ Found {len(podcasts)} podcast(s):\n\n"]
             
             for podcast_name, files in podcasts.items():
-                message += f"📻 {podcast_name}\n"
+                parts.append(f"📻 {podcast_name}\n")
                 
                 if 'transcript' in files:
                     size_kb = files['transcript']['size'] / 1024
-                    message += f"   📝 Transcript: {files['transcript']['filename']} ({size_kb:.1f} KB)\n"
+                    parts.append(f"   📝 Transcript: {files['transcript']['filename']} ({size_kb:.1f} KB)\n")
                 
                 if 'audio' in files:
                     size_mb = files['audio']['size'] / (1024 * 1024)
-                    message += f"   🎵 Audio: {files['audio']['filename']} ({size_mb:.1f} MB)\n"
+                    parts.append(f"   🎵 Audio: {files['audio']['filename']} ({size_mb:.1f} MB)\n")
                 
                 # Show most recent modification time
                 mod_times = []
@@ -512,54 +626,76 @@ class SandboxPodcastTool(SandboxToolsBase):
                 
                 if mod_times:
                     latest_mod = max(mod_times)
-                    message += f"   📅 Last modified: {latest_mod}\n"
+                    parts.append(f"   📅 Last modified: {latest_mod}\n")
                 
-                message += "\n"
+                parts.append("\n")
             
-            return self.success_response(message)
+            return self.success_response("".join(parts))
             
         except Exception as e:
             logger.error(f"Error listing podcasts: {str(e)}", exc_info=True)
             return self.fail_response(f"Error listing podcasts: {str(e)}")
 
-    def _make_fastapi_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Make request to FastAPI endpoint"""
-        try:
-            logger.info(f"Making request to {self.api_base_url}/generate")
-            response = requests.post(
-                f"{self.api_base_url}/generate",
-                json=payload,
-                timeout=360  # 5 minutes timeout for podcast generation
-            )
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"FastAPI request failed: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Podcast generation failed: {str(e)}")
+    async def _generate_audio(self, payload: Dict[str, Any]) -> Optional[bytes]:
+        """Generate a podcast via FastAPI and download its audio, or return None if no audio URL came back"""
+        result = await self._make_fastapi_request(payload)
+        if not result.get("audioUrl"):
+            return None
+        return await self._download_audio_file(result["audioUrl"])
+
+    @staticmethod
+    def _is_retryable_error(error: aiohttp.ClientError) -> bool:
+        """Whether a failed generation request is safe to send again.
+        
+        Only failures where the server cannot have started the (paid) generation qualify:
+        429 and 503 rejections, and errors while connecting. A 500/502/504 or a dropped
+        connection may leave the job running upstream, so retrying could bill it twice.
+        """
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in (429, 503)
+        return isinstance(error, aiohttp.ClientConnectorError)
 
-    def _download_audio_file(self, audio_url: str) -> str:
-        """Download the generated audio file from FastAPI"""
+    async def _make_fastapi_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Make request to FastAPI endpoint, retrying transient failures with jittered exponential backoff"""
+        url = f"{self._api_base_url}/generate"
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                logger.info(f"Making request to {url} (attempt {attempt + 1}/{self.MAX_RETRIES})")
+                session = await self._get_session()
+                async with session.post(
+                    url,
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=360)  # 6 minutes timeout for podcast generation
+                ) as response:
+                    response.raise_for_status()
+                    return await response.json()
+                
+            except aiohttp.ClientError as e:
+                if not self._is_retryable_error(e) or attempt == self.MAX_RETRIES - 1:
+                    raise Exception(f"FastAPI request failed: {str(e)}")
+                error = e
+            except Exception as e:
+                raise Exception(f"Podcast generation failed: {str(e)}")
+            
+            delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * (2 ** attempt) * (1 + random.random() * 0.5))
+            logger.warning(f"Podcastfy request failed ({str(error)}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _download_audio_file(self, audio_url: str) -> bytes:
+        """Download the generated audio file from FastAPI and return its content"""
         try:
             # Construct full URL if relative
             if audio_url.startswith('/'):
-                download_url = f"{self.api_base_url}{audio_url}"
+                download_url = f"{self._api_base_url}{audio_url}"
             else:
                 download_url = audio_url
             
             logger.info(f"Downloading audio from: {download_url}")
             
-            # Download the file
-            response = requests.get(download_url, timeout=60)
-            response.raise_for_status()
-            
-            # Save to temporary location using tempfile
-            import tempfile
-            filename = audio_url.split('/')[-1]  # Extract filename from URL
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{filename}") as temp_file:
-                temp_file.write(response.content)
-                return temp_file.name
+            session = await self._get_session()
+            async with session.get(download_url, timeout=aiohttp.ClientTimeout(total=60)) as response:
+                response.raise_for_status()
+                return await response.read()
             
         except Exception as e:
             raise Exception(f"Failed to download audio file: {str(e)}")
@@ -567,118 +703,122 @@ class SandboxPodcastTool(SandboxToolsBase):
     # Define the available functions for the agent
     @property  
     def xml_function_list(self):
-        return [
-            {
-                "name": "generate_podcast",
-                "description": "Generate an AI podcast from URLs, text, or files using advanced conversation AI",
-                "parameters": [
-                    {"name": "urls", "type": "List[str]", "description": "List of URLs to process", "required": False},
-                    {"name": "file_paths", "type": "List[str]", "description": "List of file paths in sandbox (content read as text)", "required": False},
-                    {"name": "text", "type": "str", "description": "Direct text input for podcast generation", "required": False},
-                    {"name": "topic", "type": "str", "description": "Topic or subject for the podcast", "required": False},
-                    {"name": "output_name", "type": "str", "description": "Custom name for output files", "required": False},
-                    {"name": "conversation_style", "type": "List[str]", "description": "Style like ['engaging','fast-paced']", "required": False},
-                    {"name": "podcast_length", "type": "str", "description": "Length: short/medium/long", "required": False},
-                    {"name": "roles_person1", "type": "str", "description": "Role of first speaker", "required": False},
-                    {"name": "roles_person2", "type": "str", "description": "Role of second speaker", "required": False},
-                    {"name": "dialogue_structure", "type": "List[str]", "description": "Structure like ['Introduction','Content','Conclusion']", "required": False},
-                    {"name": "podcast_name", "type": "str", "description": "Name of the podcast", "required": False},
-                    {"name": "podcast_tagline", "type": "str", "description": "Podcast tagline", "required": False},
-                    {"name": "creativity", "type": "float", "description": "Creativity level 0-1 (default: 0.7)", "required": False},
-                    {"name": "user_instructions", "type": "str", "description": "Custom instructions", "required": False},
-                    {"name": "language", "type": "str", "description": "Language (default: 'English')", "required": False},
-                    {"name": "voices", "type": "Dict[str,str]", "description": "Voice config", "required": False}
-                ]
-            },
-            {
-                "name": "list_podcasts", 
-                "description": "List all generated podcasts in the workspace",
-                "parameters": []
-            }
-        ]
+        return _XML_FUNCTION_LIST
 
     @property
     def openapi_schema(self):
-        return {
-            "openapi": "3.0.0",
-            "info": {
-                "title": "Podcast Generation Tool",
-                "description": "Generate AI podcasts from content using Podcastfy FastAPI",
-                "version": "3.0.0"
-            },
-            "servers": [{"url": "http://localhost"}],
-            "paths": {
-                "/generate_podcast": {
-                    "post": {
-                        "summary": "Generate AI Podcast",
-                        "description": "Create a conversational podcast from URLs, text, or files",
-                        "requestBody": {
-                            "required": True,
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "urls": {"type": "array", "items": {"type": "string"}, "description": "URLs to process"},
-                                            "file_paths": {"type": "array", "items": {"type": "string"}, "description": "File paths in sandbox (content read as text)"},
-                                            "text": {"type": "string", "description": "Direct text input for podcast generation"},
-                                            "topic": {"type": "string", "description": "Topic or subject for the podcast"},
-                                            "output_name": {"type": "string", "description": "Custom output name"},
-                                            "conversation_style": {"type": "array", "items": {"type": "string"}, "description": "Conversation style"},
-                                            "podcast_length": {"type": "string", "enum": ["short", "medium", "long"], "description": "Podcast length"},
-                                            "roles_person1": {"type": "string", "default": "main summarizer", "description": "Role of first speaker"},
-                                            "roles_person2": {"type": "string", "default": "questioner", "description": "Role of second speaker"},
-                                            "dialogue_structure": {"type": "array", "items": {"type": "string"}, "description": "Dialogue structure"},
-                                            "podcast_name": {"type": "string", "default": "AI Generated Podcast", "description": "Podcast name"},
-                                            "podcast_tagline": {"type": "string", "description": "Podcast tagline"},
-                                            "creativity": {"type": "number", "minimum": 0, "maximum": 1, "default": 0.7, "description": "Creativity level"},
-                                            "user_instructions": {"type": "string", "description": "Custom instructions"},
-                                            "language": {"type": "string", "default": "English", "description": "Language"},
-                                            "voices": {"type": "object", "description": "Voice configuration"}
-                                        }
-                                    }
+        return _OPENAPI_SCHEMA
+
+
+# Static tool descriptions, built once at import rather than on every property access
+_XML_FUNCTION_LIST = [
+    {
+        "name": "generate_podcast",
+        "description": "Generate an AI podcast from URLs, text, or files using advanced conversation AI",
+        "parameters": [
+            {"name": "urls", "type": "List[str]", "description": "List of URLs to process", "required": False},
+            {"name": "file_paths", "type": "List[str]", "description": "List of file paths in sandbox (content read as text)", "required": False},
+            {"name": "text", "type": "str", "description": "Direct text input for podcast generation", "required": False},
+            {"name": "topic", "type": "str", "description": "Topic or subject for the podcast", "required": False},
+            {"name": "output_name", "type": "str", "description": "Custom name for output files", "required": False},
+            {"name": "conversation_style", "type": "List[str]", "description": "Style like ['engaging','fast-paced']", "required": False},
+            {"name": "podcast_length", "type": "str", "description": "Length: short/medium/long", "required": False},
+            {"name": "roles_person1", "type": "str", "description": "Role of first speaker", "required": False},
+            {"name": "roles_person2", "type": "str", "description": "Role of second speaker", "required": False},
+            {"name": "dialogue_structure", "type": "List[str]", "description": "Structure like ['Introduction','Content','Conclusion']", "required": False},
+            {"name": "podcast_name", "type": "str", "description": "Name of the podcast", "required": False},
+            {"name": "podcast_tagline", "type": "str", "description": "Podcast tagline", "required": False},
+            {"name": "creativity", "type": "float", "description": "Creativity level 0-1 (default: 0.7)", "required": False},
+            {"name": "user_instructions", "type": "str", "description": "Custom instructions", "required": False},
+            {"name": "language", "type": "str", "description": "Language (default: 'English')", "required": False},
+            {"name": "voices", "type": "Dict[str,str]", "description": "Voice config", "required": False}
+        ]
+    },
+    {
+        "name": "list_podcasts", 
+        "description": "List all generated podcasts in the workspace",
+        "parameters": []
+    }
+]
+
+_OPENAPI_SCHEMA = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "Podcast Generation Tool",
+        "description": "Generate AI podcasts from content using Podcastfy FastAPI",
+        "version": "3.0.0"
+    },
+    "servers": [{"url": "http://localhost"}],
+    "paths": {
+        "/generate_podcast": {
+            "post": {
+                "summary": "Generate AI Podcast",
+                "description": "Create a conversational podcast from URLs, text, or files",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "urls": {"type": "array", "items": {"type": "string"}, "description": "URLs to process"},
+                                    "file_paths": {"type": "array", "items": {"type": "string"}, "description": "File paths in sandbox (content read as text)"},
+                                    "text": {"type": "string", "description": "Direct text input for podcast generation"},
+                                    "topic": {"type": "string", "description": "Topic or subject for the podcast"},
+                                    "output_name": {"type": "string", "description": "Custom output name"},
+                                    "conversation_style": {"type": "array", "items": {"type": "string"}, "description": "Conversation style"},
+                                    "podcast_length": {"type": "string", "enum": ["short", "medium", "long"], "description": "Podcast length"},
+                                    "roles_person1": {"type": "string", "default": "main summarizer", "description": "Role of first speaker"},
+                                    "roles_person2": {"type": "string", "default": "questioner", "description": "Role of second speaker"},
+                                    "dialogue_structure": {"type": "array", "items": {"type": "string"}, "description": "Dialogue structure"},
+                                    "podcast_name": {"type": "string", "default": "AI Generated Podcast", "description": "Podcast name"},
+                                    "podcast_tagline": {"type": "string", "description": "Podcast tagline"},
+                                    "creativity": {"type": "number", "minimum": 0, "maximum": 1, "default": 0.7, "description": "Creativity level"},
+                                    "user_instructions": {"type": "string", "description": "Custom instructions"},
+                                    "language": {"type": "string", "default": "English", "description": "Language"},
+                                    "voices": {"type": "object", "description": "Voice configuration"}
                                 }
                             }
-                        },
-                        "responses": {
-                            "200": {
-                                "description": "Podcast generated successfully",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "properties": {
-                                                "success": {"type": "boolean"},
-                                                "message": {"type": "string"},
-                                                "audio_file": {"type": "string"},
-                                                "filename": {"type": "string"},
-                                                "configuration": {"type": "object"}
-                                            }
-                                        }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Podcast generated successfully",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "success": {"type": "boolean"},
+                                        "message": {"type": "string"},
+                                        "audio_file": {"type": "string"},
+                                        "filename": {"type": "string"},
+                                        "configuration": {"type": "object"}
                                     }
                                 }
                             }
                         }
                     }
-                },
-                "/list_podcasts": {
-                    "get": {
-                        "summary": "List Generated Podcasts",
-                        "description": "Get a list of all generated podcasts",
-                        "responses": {
-                            "200": {
-                                "description": "List of podcasts",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "properties": {
-                                                "success": {"type": "boolean"},
-                                                "podcasts": {"type": "array"},
-                                                "total_count": {"type": "integer"},
-                                                "message": {"type": "string"}
-                                            }
-                                        }
+                }
+            }
+        },
+        "/list_podcasts": {
+            "get": {
+                "summary": "List Generated Podcasts",
+                "description": "Get a list of all generated podcasts",
+                "responses": {
+                    "200": {
+                        "description": "List of podcasts",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "success": {"type": "boolean"},
+                                        "podcasts": {"type": "array"},
+                                        "total_count": {"type": "integer"},
+                                        "message": {"type": "string"}
                                     }
                                 }
                             }
@@ -686,4 +826,6 @@ class SandboxPodcastTool(SandboxToolsBase):
                     }
                 }
             }
-        } 
\ No newline at end of file
+        }
+    }
+}
@@ -88,6 +88,10 @@ async def lifespan(app: FastAPI):
         logger.info("Cleaning up agent resources")
         await agent_api.cleanup()
         
+        # Close the podcast tool's shared HTTP session
+        from agent.tools.sb_podcast_tool import SandboxPodcastTool
+        await SandboxPodcastTool.close_session()
+        
         # Clean up Redis connection
         try:
             logger.info("Closing Redis connection")
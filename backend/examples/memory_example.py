@@ -10,6 +10,12 @@ import os
 from services.memory import memory_service
 from utils.logger import logger
 
+def _print_memories(results):
+    """Print search results as a numbered list with their confidence scores."""
+    for i, result in enumerate(results, 1):
+        memory_content = result.get('memory') or result.get('text') or 'No content'
+        print(f"  {i}. {memory_content} (confidence: {result.get('score', 0.0):.2f})")
+
 async def main():
     """Example of how memory functionality works in the application."""
     
@@ -45,32 +51,38 @@ async def main():
         {"role": "assistant", "content": "Perfect! San Francisco has amazing seafood. You should definitely try the clam chowder at Fisherman's Wharf."}
     ]
     
-    # Add memories for default operator (user_id only)
-    print("Adding memories for default operator...")
-    for i in range(0, len(messages), 2):
-        memory_batch = messages[i:i+2]
-        result = await memory_service.add_memory_async(
-            messages=memory_batch,
-            user_id=user_id,
-            metadata={"example": "travel_planning"}
-        )
-        if result:
-            print(f"✅ Added memory batch {i//2 + 1}")
-    
-    # Add memories for custom agent (user_id + agent_id)
-    print("\nAdding memories for custom agent...")
+    # Memories for the custom agent (user_id + agent_id)
     custom_messages = [
         {"role": "user", "content": "I prefer budget-friendly options"},
         {"role": "assistant", "content": "I'll focus on affordable recommendations for your San Francisco trip."}
     ]
     
-    result = await memory_service.add_memory_async(
-        messages=custom_messages,
-        user_id=user_id,
-        agent_id=agent_id,
-        metadata={"example": "budget_preferences"}
+    async def add_default_operator_batches():
+        # Batches of one conversation stay in order: mem0 compares each batch against the
+        # user's existing memories to decide whether to add or update
+        for i in range(0, len(messages), 2):
+            memory_batch = messages[i:i+2]
+            result = await memory_service.add_memory_async(
+                messages=memory_batch,
+                user_id=user_id,
+                metadata={"example": "travel_planning"}
+            )
+            if result:
+                print(f"✅ Added memory batch {i//2 + 1}")
+    
+    # The custom agent's memories are independent of the default operator's, so add both together
+    print("Adding memories for default operator and custom agent...")
+    _, custom_result = await asyncio.gather(
+        add_default_operator_batches(),
+        memory_service.add_memory_async(
+            messages=custom_messages,
+            user_id=user_id,
+            agent_id=agent_id,
+            metadata={"example": "budget_preferences"}
+        )
     )
-    if result:
+    
+    if custom_result:
         print("✅ Added custom agent memory")
     
     # Example 2: Searching memories
@@ -85,37 +97,36 @@ async def main():
         "San Francisco recommendations"
     ]
     
-    for query in search_queries:
-        results = await memory_service.search_memory_async(
-            query=query,
+    # Run the default operator and custom agent searches concurrently
+    *query_results, custom_results = await asyncio.gather(
+        *(
+            memory_service.search_memory_async(
+                query=query,
+                user_id=user_id,
+                limit=3
+            )
+            for query in search_queries
+        ),
+        memory_service.search_memory_async(
+            query="budget preferences",
             user_id=user_id,
+            agent_id=agent_id,
             limit=3
         )
-        
+    )
+    
+    for query, results in zip(search_queries, query_results):
         if results:
             print(f"\n📋 Results for '{query}':")
-            for i, result in enumerate(results, 1):
-                memory_content = result.get('memory', 'No content')
-                score = result.get('score', 0.0)
-                print(f"  {i}. {memory_content} (confidence: {score:.2f})")
+            _print_memories(results)
         else:
             print(f"❌ No results found for '{query}'")
     
-    # Search for custom agent memories
+    # Custom agent memories
     print(f"\n🔍 Searching memories for custom agent...")
-    custom_results = await memory_service.search_memory_async(
-        query="budget preferences",
-        user_id=user_id,
-        agent_id=agent_id,
-        limit=3
-    )
-    
     if custom_results:
         print("📋 Custom agent results:")
-        for i, result in enumerate(custom_results, 1):
-            memory_content = result.get('memory', 'No content')
-            score = result.get('score', 0.0)
-            print(f"  {i}. {memory_content} (confidence: {score:.2f})")
+        _print_memories(custom_results)
     else:
         print("❌ No custom agent results found")
     
@@ -126,6 +137,14 @@ async def main():
     print("- Agents can search memory using the search_memory tool")
     print("- Default operators use user_id only")
     print("- Custom agents use combined user_id:agent_id identifier")
+    print("- Call memory_service.aclose() on shutdown to release its pooled connections")
+
+async def run():
+    """Run the example and release the memory service's connections afterwards."""
+    try:
+        await main()
+    finally:
+        await memory_service.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(run())
\ No newline at end of file
@@ -1,8 +1,13 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, Body
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from collections import OrderedDict
 import os
 import json
+import asyncio
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from composio import Composio
 from composio.types import auth_scheme
 from services.supabase import DBConnection
@@ -22,10 +27,78 @@ if not COMPOSIO_API_KEY:
 
 composio = Composio(api_key=COMPOSIO_API_KEY)
 
+# The Composio SDK is synchronous. Its calls run on a dedicated, bounded pool so a slow
+# Composio API cannot exhaust the default executor shared with other to_thread work.
+_composio_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("COMPOSIO_MAX_WORKERS", "16")),
+    thread_name_prefix="composio"
+)
+
+async def _run_composio(func, *args, **kwargs):
+    """Run a blocking Composio SDK call on the Composio executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_composio_executor, functools.partial(func, *args, **kwargs))
+
 # Composio integration IDs (these are public identifiers, not secrets)
 OUTLOOK_INTEGRATION_ID = os.getenv("COMPOSIO_OUTLOOK_INTEGRATION_ID")
 DROPBOX_INTEGRATION_ID = os.getenv("COMPOSIO_DROPBOX_INTEGRATION_ID")
 
+# Integrations offered to users: type -> display metadata and Composio auth config ID.
+# Add new integrations here; the list endpoint and the initiate flow both read this table.
+SUPPORTED_INTEGRATIONS: Dict[str, Dict[str, Any]] = {
+    "outlook": {
+        "name": "Microsoft Outlook",
+        "description": "Connect your Outlook account to send and manage emails",
+        "icon": "📧",
+        "integration_id": OUTLOOK_INTEGRATION_ID,
+    },
+    "dropbox": {
+        "name": "Dropbox",
+        "description": "Connect your Dropbox account to manage files and folders",
+        "icon": "📁",
+        "integration_id": DROPBOX_INTEGRATION_ID,
+    },
+}
+
+# Integration type -> Composio auth config ID, for the types whose ID is configured
+INTEGRATION_IDS: Dict[str, str] = {
+    integration_type: info["integration_id"]
+    for integration_type, info in SUPPORTED_INTEGRATIONS.items()
+    if info["integration_id"]
+}
+
+# Frontends poll the status endpoint while the user completes OAuth. Only let a pending
+# integration reach Composio once its next check is due: a plain "not authorized yet" result
+# waits a short fixed interval, while Composio errors back off exponentially up to a minute.
+VERIFY_PENDING_INTERVAL = 3.0
+VERIFY_INITIAL_ERROR_INTERVAL = 2.0
+VERIFY_MAX_ERROR_INTERVAL = 60.0
+VERIFY_MAX_ENTRIES = 10_000
+# integration row id -> (next check at, current error interval), least recently deferred first
+_verify_backoff: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+
+def _verification_due(integration_row_id: str) -> bool:
+    """Whether a pending integration may be checked against Composio now."""
+    next_check_at, _ = _verify_backoff.get(integration_row_id, (0.0, 0.0))
+    return time.monotonic() >= next_check_at
+
+def _defer_verification(integration_row_id: str, failed: bool = False) -> None:
+    """Schedule the next Composio check for a pending integration.
+    
+    Errors double the wait up to VERIFY_MAX_ERROR_INTERVAL; a successful check that simply
+    found no active connection yet resets it to VERIFY_PENDING_INTERVAL.
+    """
+    if failed:
+        _, previous = _verify_backoff.get(integration_row_id, (0.0, 0.0))
+        interval = min(max(previous * 2, VERIFY_INITIAL_ERROR_INTERVAL), VERIFY_MAX_ERROR_INTERVAL)
+    else:
+        interval = VERIFY_PENDING_INTERVAL
+    _verify_backoff[integration_row_id] = (time.monotonic() + interval, interval if failed else 0.0)
+    _verify_backoff.move_to_end(integration_row_id)
+    # Abandoned or deleted pending rows are never cleared explicitly; drop the stalest entries
+    while len(_verify_backoff) > VERIFY_MAX_ENTRIES:
+        _verify_backoff.popitem(last=False)
+
 class InitiateIntegrationRequest(BaseModel):
     integration_type: str
     account_id: Optional[str] = None  # Optional team account ID
@@ -46,42 +119,45 @@ async def initiate_composio_integration(
         # Determine the account_id to use
         effective_account_id = body.account_id if body.account_id else user_id
         
-        # Verify user has access to the account if different from personal
+        # Get integration ID based on type
+        if body.integration_type not in SUPPORTED_INTEGRATIONS:
+            raise HTTPException(status_code=400, detail=f"Unsupported integration type: {body.integration_type}")
+        integration_id = INTEGRATION_IDS.get(body.integration_type)
+        if not integration_id:
+            logger.error(f"Composio auth config ID for {body.integration_type} is not set")
+            raise HTTPException(status_code=503, detail=f"Integration {body.integration_type} is not configured")
+        
+        # Check if integration already exists; when the account is not the user's personal one,
+        # verify access (basejump account_user table) in the same round trip
+        existing_query = client.table('user_integrations').select('*').eq('account_id', effective_account_id).eq('integration_type', body.integration_type).limit(1).execute()
         if body.account_id and body.account_id != user_id:
-            # Check if user has access to this account via basejump account_user table
-            account_access = await client.schema('basejump').from_('account_user').select('account_role').eq('user_id', user_id).eq('account_id', body.account_id).execute()
+            account_access, existing = await asyncio.gather(
+                client.schema('basejump').from_('account_user').select('account_role').eq('user_id', user_id).eq('account_id', body.account_id).execute(),
+                existing_query
+            )
             if not (account_access.data and len(account_access.data) > 0):
                 logger.warning(f"User {user_id} attempted to access account {body.account_id} without permission")
                 raise HTTPException(status_code=403, detail="Not authorized to access this account")
-        
-        # Get integration ID based on type
-        integration_id = None
-        if body.integration_type == "outlook":
-            integration_id = OUTLOOK_INTEGRATION_ID
-        elif body.integration_type == "dropbox":
-            integration_id = DROPBOX_INTEGRATION_ID
         else:
-            raise HTTPException(status_code=400, detail=f"Unsupported integration type: {body.integration_type}")
+            existing = await existing_query
         
         # Use account_id as user_id for Composio
         user_id = effective_account_id
         
-        # Check if integration already exists
-        existing = await client.table('user_integrations').select('*').eq('account_id', effective_account_id).eq('integration_type', body.integration_type).execute()
-        
         if existing.data and existing.data[0].get('status') == 'connected':
             return {
                 "status": "already_connected",
                 "integration": existing.data[0]
             }
         
-        # Initiate connection with Composio using the new API
-        connection_request = composio.connected_accounts.initiate(
+        # Initiate connection with Composio using the new API, off the event loop
+        connection_request = await _run_composio(
+            composio.connected_accounts.initiate,
             user_id=user_id,
             auth_config_id=integration_id
         )
         
-        # Store or update integration record
+        # Store or update integration record in one statement; (account_id, integration_type) is unique
         integration_data = {
             "account_id": effective_account_id,
             "integration_type": body.integration_type,
@@ -96,12 +172,14 @@ async def initiate_composio_integration(
             }
         }
         
-        if existing.data:
-            # Update existing record
-            result = await client.table('user_integrations').update(integration_data).eq('id', existing.data[0]['id']).execute()
-        else:
-            # Insert new record
-            result = await client.table('user_integrations').insert(integration_data).execute()
+        result = await client.table('user_integrations').upsert(
+            integration_data,
+            on_conflict='account_id,integration_type'
+        ).execute()
+        
+        # A fresh connection attempt reuses the row id; forget any backoff left from an earlier one
+        if result.data:
+            _verify_backoff.pop(result.data[0]['id'], None)
         
         return {
             "redirect_url": connection_request.redirect_url,
@@ -109,6 +187,8 @@ async def initiate_composio_integration(
             "integration_id": result.data[0]['id'] if result.data else None
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to initiate Composio integration: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -126,16 +206,19 @@ async def get_integration_status(
         # Determine the account_id to use
         effective_account_id = account_id if account_id else user_id
         
-        # Verify user has access to the account if different from personal
+        # Get integration record; when the account is not the user's personal one,
+        # verify access (basejump account_user table) in the same round trip
+        result_query = client.table('user_integrations').select('id, status, is_enabled, connected_at, error_message, composio_entity_id, composio_connection_id, metadata').eq('account_id', effective_account_id).eq('integration_type', integration_type).limit(1).execute()
         if account_id and account_id != user_id:
-            # Check if user has access to this account via basejump account_user table
-            account_access = await client.schema('basejump').from_('account_user').select('account_role').eq('user_id', user_id).eq('account_id', account_id).execute()
+            account_access, result = await asyncio.gather(
+                client.schema('basejump').from_('account_user').select('account_role').eq('user_id', user_id).eq('account_id', account_id).execute(),
+                result_query
+            )
             if not (account_access.data and len(account_access.data) > 0):
                 logger.warning(f"User {user_id} attempted to access account {account_id} without permission")
                 raise HTTPException(status_code=403, detail="Not authorized to access this account")
-        
-        # Get integration record
-        result = await client.table('user_integrations').select('*').eq('account_id', effective_account_id).eq('integration_type', integration_type).execute()
+        else:
+            result = await result_query
         
         if not result.data:
             return {
@@ -153,11 +236,19 @@ async def get_integration_status(
                 # Get the Composio entity ID (user_id in Composio)
                 composio_entity_id = integration.get('composio_entity_id')
                 
+                if composio_entity_id and not _verification_due(integration['id']):
+                    # Checked Composio recently; answer from the database until the backoff expires
+                    return JSONResponse({
+                        "status": "pending",
+                        "message": "Waiting for authorization. Please complete the authentication flow."
+                    })
+                
                 if composio_entity_id:
                     # Check if connection exists by listing connected accounts for this user
                     try:
                         # List all connected accounts for this user
-                        connected_accounts = composio.connected_accounts.list(
+                        connected_accounts = await _run_composio(
+                            composio.connected_accounts.list,
                             user_ids=[composio_entity_id]
                         )
                         
@@ -200,10 +291,12 @@ async def get_integration_status(
                                         
                                         await client.table('user_integrations').update(update_data).eq('id', integration['id']).execute()
                                         
+                                        _verify_backoff.pop(integration['id'], None)
                                         return JSONResponse({"status": "connected", "message": "Successfully connected"})
                         
                         # No active connection found yet
                         logger.debug(f"No active connection found for {integration_type} user {composio_entity_id}")
+                        _defer_verification(integration['id'])
                         return JSONResponse({
                             "status": "pending",
                             "message": "Waiting for authorization. Please complete the authentication flow."
@@ -223,24 +316,27 @@ async def get_integration_status(
                         
                         if connection_request_id:
                             try:
-                                # Try wait_for_connection as a fallback
-                                connected_account = composio.connected_accounts.wait_for_connection(
-                                    connection_request_id=connection_request_id,
-                                    timeout=1
+                                # Fall back to reading the connection's current state; unlike
+                                # wait_for_connection this returns immediately instead of blocking
+                                connected_account = await _run_composio(
+                                    composio.connected_accounts.get,
+                                    connection_request_id
                                 )
                                 
-                                # If successful, update the database
-                                await client.table('user_integrations').update({
-                                    "status": "connected",
-                                    "connected_at": datetime.now(timezone.utc).isoformat(),
-                                    "updated_at": datetime.now(timezone.utc).isoformat(),
-                                    "composio_connection_id": connected_account.id if hasattr(connected_account, 'id') else connection_request_id
-                                }).eq('id', integration['id']).execute()
-                                
-                                return JSONResponse({"status": "connected", "message": "Successfully connected"})
-                            except:
-                                pass
+                                if getattr(connected_account, 'status', None) == 'ACTIVE':
+                                    await client.table('user_integrations').update({
+                                        "status": "connected",
+                                        "connected_at": datetime.now(timezone.utc).isoformat(),
+                                        "updated_at": datetime.now(timezone.utc).isoformat(),
+                                        "composio_connection_id": connected_account.id if hasattr(connected_account, 'id') else connection_request_id
+                                    }).eq('id', integration['id']).execute()
+                                    
+                                    _verify_backoff.pop(integration['id'], None)
+                                    return JSONResponse({"status": "connected", "message": "Successfully connected"})
+                            except Exception as e:
+                                logger.debug(f"Could not read connection {connection_request_id} for {integration_type}: {str(e)}")
                         
+                        _defer_verification(integration['id'], failed=True)
                         return JSONResponse({
                             "status": "pending",
                             "message": "Still waiting for authorization"
@@ -277,7 +373,7 @@ async def toggle_integration(
         client = await db.client
         
         # Get integration record
-        result = await client.table('user_integrations').select('*').eq('account_id', user_id).eq('integration_type', body.integration_type).execute()
+        result = await client.table('user_integrations').select('id, status').eq('account_id', user_id).eq('integration_type', body.integration_type).limit(1).execute()
         
         if not result.data:
             raise HTTPException(status_code=404, detail="Integration not found")
@@ -316,35 +412,25 @@ async def list_integrations(
         effective_account_id = account_id if account_id else user_id
         
         # Get all integrations for the account
-        result = await client.table('user_integrations').select('*').eq('account_id', effective_account_id).execute()
+        result = await client.table('user_integrations').select('id, integration_type, status, is_enabled, connected_at').eq('account_id', effective_account_id).execute()
         
         # Define available integrations with their metadata
         available_integrations = [
             {
-                "type": "outlook",
-                "name": "Microsoft Outlook",
-                "description": "Connect your Outlook account to send and manage emails",
-                "icon": "📧",
-                "status": "not_connected",
-                "is_enabled": False
-            },
-            {
-                "type": "dropbox",
-                "name": "Dropbox",
-                "description": "Connect your Dropbox account to manage files and folders",
-                "icon": "📁",
+                "type": integration_type,
+                "name": info["name"],
+                "description": info["description"],
+                "icon": info["icon"],
                 "status": "not_connected",
                 "is_enabled": False
             }
-            # Add more integrations here in the future
+            for integration_type, info in SUPPORTED_INTEGRATIONS.items()
         ]
         
         # Update status for connected integrations
+        by_type = {i['integration_type']: i for i in result.data}
         for integration in available_integrations:
-            connected = next(
-                (i for i in result.data if i['integration_type'] == integration['type']),
-                None
-            )
+            connected = by_type.get(integration['type'])
             if connected:
                 integration['status'] = connected['status']
                 integration['is_enabled'] = connected.get('is_enabled', False)
@@ -371,22 +457,26 @@ async def disconnect_integration(
         # Determine the account_id to use
         effective_account_id = body.account_id if body.account_id else user_id
         
-        # Verify user has access to the account if different from personal
+        # Check if integration exists; when the account is not the user's personal one,
+        # verify access (basejump account_user table) in the same round trip
+        existing_query = client.table('user_integrations').select('id').eq('account_id', effective_account_id).eq('integration_type', body.integration_type).limit(1).execute()
         if body.account_id and body.account_id != user_id:
-            # Check if user has access to this account via basejump account_user table
-            account_access = await client.schema('basejump').from_('account_user').select('account_role').eq('user_id', user_id).eq('account_id', body.account_id).execute()
+            account_access, existing = await asyncio.gather(
+                client.schema('basejump').from_('account_user').select('account_role').eq('user_id', user_id).eq('account_id', body.account_id).execute(),
+                existing_query
+            )
             if not (account_access.data and len(account_access.data) > 0):
                 logger.warning(f"User {user_id} attempted to access account {body.account_id} without permission")
                 raise HTTPException(status_code=403, detail="Not authorized to access this account")
-        
-        # Check if integration exists
-        existing = await client.table('user_integrations').select('*').eq('account_id', effective_account_id).eq('integration_type', body.integration_type).execute()
+        else:
+            existing = await existing_query
         
         if not existing.data:
             raise HTTPException(status_code=404, detail=f"Integration {body.integration_type} not found")
         
         # Delete the integration from database
         await client.table('user_integrations').delete().eq('account_id', effective_account_id).eq('integration_type', body.integration_type).execute()
+        _verify_backoff.pop(existing.data[0]['id'], None)
         
         logger.info(f"Successfully disconnected {body.integration_type} integration for account {effective_account_id}")
         
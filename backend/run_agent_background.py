@@ -27,8 +27,23 @@ rabbitmq_vhost = os.getenv('RABBITMQ_VHOST', '/')
 # Create connection URL
 rabbitmq_url = f"amqp://{rabbitmq_user}:{rabbitmq_password}@{rabbitmq_host}:{rabbitmq_port}/{rabbitmq_vhost}"
 
-# Initialize broker with connection URL
-rabbitmq_broker = RabbitmqBroker(url=rabbitmq_url, middleware=[dramatiq.middleware.AsyncIO()])
+class CloseSharedSessions(dramatiq.Middleware):
+    """Close process-wide HTTP sessions on the worker's event loop before it stops."""
+
+    def before_worker_shutdown(self, broker, worker):
+        from dramatiq.asyncio import get_event_loop_thread
+        from agent.tools.sb_podcast_tool import SandboxPodcastTool
+        event_loop_thread = get_event_loop_thread()
+        if event_loop_thread is None:
+            return
+        try:
+            event_loop_thread.run_coroutine(SandboxPodcastTool.close_session())
+        except Exception as e:
+            logger.error(f"Error closing podcast HTTP session: {e}")
+
+# Initialize broker with connection URL; CloseSharedSessions is listed before AsyncIO so its
+# shutdown hook runs while the event loop is still up
+rabbitmq_broker = RabbitmqBroker(url=rabbitmq_url, middleware=[CloseSharedSessions(), dramatiq.middleware.AsyncIO()])
 dramatiq.set_broker(rabbitmq_broker)
 
 _initialized = False
@@ -307,6 +307,26 @@ class MemoryService:
         except Exception as e:
             logger.error(f"Failed to search memory for user {user_id}: {e}")
             return None
+    
+    async def aclose(self):
+        """Close the pooled HTTP clients held by the mem0 clients."""
+        # mem0 keeps one httpx client per MemoryClient, so every call reuses the same
+        # connection pool; it only needs closing when the process is done with memory
+        if self._async_client is not None:
+            async_http = getattr(self._async_client, "async_client", None)
+            if async_http is not None:
+                await async_http.aclose()
+            else:
+                logger.warning("mem0 AsyncMemoryClient has no 'async_client' attribute - its HTTP pool was not closed")
+            self._async_client = None
+        if self._sync_client is not None:
+            sync_http = getattr(self._sync_client, "client", None)
+            if sync_http is not None:
+                sync_http.close()
+            else:
+                logger.warning("mem0 MemoryClient has no 'client' attribute - its HTTP pool was not closed")
+            self._sync_client = None
+        self._initialized = False
 
 
 # Global memory service instance
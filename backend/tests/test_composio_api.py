@@ -0,0 +1,64 @@
+import os
+import pytest
+from unittest.mock import patch
+
+os.environ.setdefault("COMPOSIO_API_KEY", "test-key")
+
+from integrations import composio_api
+from integrations.composio_api import _defer_verification, _verification_due, _verify_backoff
+
+
+class TestVerificationBackoff:
+
+    @pytest.fixture(autouse=True)
+    def clear_backoff(self):
+        _verify_backoff.clear()
+        yield
+        _verify_backoff.clear()
+
+    def test_errors_double_the_interval_up_to_the_cap(self):
+        """Test consecutive Composio errors back off 2, 4, 8, ... seconds, capped at 60."""
+        with patch('integrations.composio_api.time.monotonic', return_value=1000.0):
+            for expected in [2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0]:
+                _defer_verification("row-1", failed=True)
+                assert _verify_backoff["row-1"] == (1000.0 + expected, expected)
+
+    def test_plain_pending_result_uses_fixed_interval_and_resets_errors(self):
+        """Test a check that finds no active connection waits 3s and clears the error backoff."""
+        with patch('integrations.composio_api.time.monotonic', return_value=1000.0):
+            _defer_verification("row-1", failed=True)
+            _defer_verification("row-1", failed=True)
+            assert _verify_backoff["row-1"][1] == 4.0
+
+            _defer_verification("row-1")
+            assert _verify_backoff["row-1"] == (1000.0 + composio_api.VERIFY_PENDING_INTERVAL, 0.0)
+
+            # The next error starts the doubling over from the initial interval
+            _defer_verification("row-1", failed=True)
+            assert _verify_backoff["row-1"][1] == composio_api.VERIFY_INITIAL_ERROR_INTERVAL
+
+    def test_least_recently_deferred_entries_are_evicted_first(self):
+        """Test the backoff table drops the stalest rows once it exceeds VERIFY_MAX_ENTRIES."""
+        with patch.object(composio_api, 'VERIFY_MAX_ENTRIES', 3):
+            for row_id in ["a", "b", "c"]:
+                _defer_verification(row_id)
+            # Deferring "a" again makes "b" the least recently deferred
+            _defer_verification("a")
+            _defer_verification("d")
+            assert list(_verify_backoff) == ["c", "a", "d"]
+
+    def test_verification_due_before_and_after_deadline(self):
+        """Test a row is due when unknown, not due inside its interval, and due again after it."""
+        assert _verification_due("row-1") is True
+
+        with patch('integrations.composio_api.time.monotonic', return_value=100.0):
+            _defer_verification("row-1")
+
+        with patch('integrations.composio_api.time.monotonic', return_value=102.9):
+            assert _verification_due("row-1") is False
+        with patch('integrations.composio_api.time.monotonic', return_value=103.0):
+            assert _verification_due("row-1") is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
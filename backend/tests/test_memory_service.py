@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from services.memory import MemoryService
+
+
+class TestMemoryServiceClose:
+    
+    @pytest.fixture
+    def memory_service(self):
+        with patch.object(MemoryService, '_initialize_clients'):
+            service = MemoryService()
+        service._async_client = Mock(async_client=Mock(aclose=AsyncMock()))
+        service._sync_client = Mock(client=Mock(close=Mock()))
+        service._initialized = True
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_aclose_closes_both_http_clients(self, memory_service):
+        """Test aclose closes the httpx clients held by both mem0 clients."""
+        async_http = memory_service._async_client.async_client
+        sync_http = memory_service._sync_client.client
+        
+        await memory_service.aclose()
+        
+        async_http.aclose.assert_awaited_once()
+        sync_http.close.assert_called_once()
+        assert not memory_service.is_available
+    
+    @pytest.mark.asyncio
+    async def test_aclose_warns_when_http_client_attribute_is_missing(self, memory_service):
+        """Test aclose logs a warning instead of silently skipping an unknown mem0 client layout."""
+        memory_service._async_client = Mock(spec=[])
+        memory_service._sync_client = Mock(spec=[])
+        
+        with patch('services.memory.logger') as mock_logger:
+            await memory_service.aclose()
+        
+        assert mock_logger.warning.call_count == 2
+        assert not memory_service.is_available
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,6 +1,8 @@
 import pytest
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
+import aiohttp
+import re
 from agent.tools.sb_podcast_tool import SandboxPodcastTool
 from agentpress.thread_manager import ThreadManager
 
@@ -83,5 +85,57 @@ class TestSandboxPodcastTool:
                 assert "Podcast generated successfully" in result.output
 
 
+class TestPodcastRetryClassification:
+    
+    @staticmethod
+    def _response_error(status):
+        return aiohttp.ClientResponseError(request_info=Mock(), history=(), status=status)
+    
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_rejected_before_generation_is_retried(self, status):
+        """Test 429/503 responses are retried since no generation ran."""
+        assert SandboxPodcastTool._is_retryable_error(self._response_error(status)) is True
+    
+    @pytest.mark.parametrize("status", [400, 404, 422, 500, 502, 504])
+    def test_other_statuses_are_not_retried(self, status):
+        """Test client errors and possibly-started server failures are not retried."""
+        assert SandboxPodcastTool._is_retryable_error(self._response_error(status)) is False
+    
+    def test_connect_error_is_retried(self):
+        """Test errors while connecting are retried."""
+        error = aiohttp.ClientConnectorError(Mock(), OSError(111, "Connection refused"))
+        assert SandboxPodcastTool._is_retryable_error(error) is True
+    
+    def test_disconnect_mid_generation_is_not_retried(self):
+        """Test a dropped connection after the request was sent is not retried."""
+        assert SandboxPodcastTool._is_retryable_error(aiohttp.ServerDisconnectedError()) is False
+
+
+
+class TestPodcastOutputName:
+    
+    @pytest.mark.parametrize("name", ["../../x", "../podcasts/../../etc/passwd", "/etc/passwd", "a/b\\c"])
+    def test_path_components_are_neutralised(self, name):
+        """Test separators and parent references cannot escape podcasts/."""
+        safe = SandboxPodcastTool._safe_output_name(name)
+        assert "/" not in safe and "\\" not in safe and ".." not in safe
+        assert safe
+    
+    def test_traversal_is_replaced_character_for_character(self):
+        """Test unsafe characters map to underscores while safe ones are kept."""
+        assert SandboxPodcastTool._safe_output_name("../../x") == "______x"
+        assert SandboxPodcastTool._safe_output_name("My Podcast-1") == "My_Podcast-1"
+    
+    @pytest.mark.parametrize("name", [None, "", "   ", "\t\n"])
+    def test_empty_names_fall_back_to_generated_name(self, name):
+        """Test missing or whitespace-only names get a generated podcast_<epoch>_<hex> name."""
+        safe = SandboxPodcastTool._safe_output_name(name)
+        assert re.fullmatch(r"podcast_\d+_[0-9a-f]{6}", safe)
+    
+    def test_name_is_capped_at_100_characters(self):
+        """Test long names are truncated to 100 characters."""
+        assert SandboxPodcastTool._safe_output_name("a" * 250) == "a" * 100
+
+
 if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
+    pytest.main([__file__]) 